@@ -8,6 +8,7 @@ and that the tag is in the CHANGELOG.
 """
 
 import pathlib
+import re
 import subprocess
 import sys
 
@@ -16,15 +17,10 @@ import typer
 from packaging.version import InvalidVersion, Version
 
 
-if sys.version_info >= (3, 11):
-    import tomllib
-else:
-    # We can remove this when we drop support for Python 3.10.
-    import tomli as tomllib
-
-
-PYPROJECT_FILE = pathlib.Path(__file__).resolve().parent.parent / "pyproject.toml"
-CHANGELOG_FILE = pathlib.Path(__file__).resolve().parent.parent / "CHANGELOG.md"
+# Resolve the repository root once, rather than per file we point at.
+REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent
+PYPROJECT_FILE = REPO_ROOT / "pyproject.toml"
+CHANGELOG_FILE = REPO_ROOT / "CHANGELOG.md"
 app = typer.Typer()
 
 
@@ -55,8 +51,18 @@ def main() -> None:
     (tag_version,) = versions
 
     # Get the version from the pyproject.toml file.
-    pyproject_content = PYPROJECT_FILE.read_text()
-    project_config = tomllib.loads(pyproject_content)
+    # The TOML parser import is deferred to here so that we don't pay for it
+    # when the script bails out before parsing (e.g. when there are no tags).
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:
+        # We can remove this when we drop support for Python 3.10.
+        import tomli as tomllib
+
+    # tomllib wants a binary file, which also skips a pointless decode:
+    # the parser handles the UTF-8 itself.
+    with PYPROJECT_FILE.open("rb") as pyproject_file:
+        project_config = tomllib.load(pyproject_file)
     project_version_str = project_config["project"]["version"]
     project_version = Version(project_version_str)
 
@@ -70,10 +76,18 @@ def main() -> None:
         raise typer.Abort()
 
     # Check that the tag is in the CHANGELOG.
-    return_code = subprocess.run(
-        ["git", "grep", rf"\bv{tag_version}\b", "HEAD", "--", str(CHANGELOG_FILE)],
-    ).returncode
-    if return_code == 0:
+    # We fetch the committed CHANGELOG once and search it here,
+    # rather than spawning a separate `git grep` for the check.
+    changelog_result = subprocess.run(
+        ["git", "show", f"HEAD:{CHANGELOG_FILE.name}"],
+        capture_output=True,
+        text=True,
+        cwd=CHANGELOG_FILE.parent,
+    )
+    changelog_content = (
+        changelog_result.stdout if changelog_result.returncode == 0 else ""
+    )
+    if re.search(rf"\bv{re.escape(str(tag_version))}\b", changelog_content):
         rich.print("[green]Tag found in CHANGELOG.")
     else:
         rich.print(f"[red]Tag not committed to CHANGELOG:[/] {tag_version}.")
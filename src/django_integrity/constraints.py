@@ -1,7 +1,10 @@
 import contextlib
+import functools
+import itertools
 from collections.abc import Iterator, Sequence
 
-from django.db import connections, models, transaction
+from django.db import connections, models
+from django.db.backends.base.base import BaseDatabaseWrapper
 
 
 try:
@@ -38,6 +41,23 @@ except ImportError:
 # - https://docs.djangoproject.com/en/5.0/ref/models/constraints/#deferrable
 
 
+# Used to generate savepoint names which are unique within any transaction.
+_savepoint_ids = itertools.count()
+
+
+@functools.lru_cache(maxsize=256)
+def _names_sql(names: tuple[str, ...]) -> sql.Composed:
+    """
+    Compose (and memoize) a comma-separated list of quoted constraint names.
+
+    Callers tend to pass the same constraint names over and over,
+    so there's no need to rebuild the identifier list each time.
+    The cache is bounded in case names are generated dynamically,
+    which would otherwise accumulate forever.
+    """
+    return sql.SQL(", ").join(sql.Identifier(name) for name in names)
+
+
 @contextlib.contextmanager
 def immediate(names: Sequence[str], *, using: str) -> Iterator[None]:
     """
@@ -55,8 +75,10 @@ def immediate(names: Sequence[str], *, using: str) -> Iterator[None]:
     To be sure that the constraints are restored to DEFERRED
     even if an exception is raised, we use a savepoint.
 
-    This could be expensive if used in a loop because on every iteration we would
-    create and close (or roll back) a savepoint, and set and unset the constraint state.
+    To keep the overhead down (e.g. when used in a loop),
+    the savepoint management and the constraint changes are batched
+    into a single statement on entry and another on exit,
+    so each costs only one database round trip.
 
     # See Note [Deferrable constraints]
 
@@ -67,12 +89,59 @@ def immediate(names: Sequence[str], *, using: str) -> Iterator[None]:
     Raises:
         NotInTransaction: When we try to change constraints outside of a transaction.
     """
-    set_immediate(names, using=using)
-    try:
-        with transaction.atomic(using=using):
+    connection = _require_transaction(using)
+    savepoint_name = f"django_integrity_{next(_savepoint_ids)}"
+
+    # Django's cursor.execute accepts composed queries and plain strings alike.
+    enter_query: sql.Composed | str
+    exit_query: sql.Composed | str
+    error_query: sql.Composed | str
+
+    if names:
+        savepoint = sql.Identifier(savepoint_name)
+        names_sql = _names_sql(tuple(names))
+        enter_query = sql.SQL(
+            "SAVEPOINT {savepoint}; SET CONSTRAINTS {names} IMMEDIATE"
+        ).format(savepoint=savepoint, names=names_sql)
+        exit_query = sql.SQL(
+            "SET CONSTRAINTS {names} DEFERRED; RELEASE SAVEPOINT {savepoint}"
+        ).format(savepoint=savepoint, names=names_sql)
+        error_query = sql.SQL(
+            "ROLLBACK TO SAVEPOINT {savepoint}; SET CONSTRAINTS {names} DEFERRED"
+        ).format(savepoint=savepoint, names=names_sql)
+    else:
+        # With no constraints to manage there's nothing to quote:
+        # the savepoint name is one we generated ourselves,
+        # so plain strings are safe and skip the sql composition.
+        enter_query = f"SAVEPOINT {savepoint_name}"
+        exit_query = f"RELEASE SAVEPOINT {savepoint_name}"
+        error_query = f"ROLLBACK TO SAVEPOINT {savepoint_name}"
+
+    # One cursor serves both entry and exit,
+    # so we don't pay for cursor setup twice per block.
+    with connection.cursor() as cursor:
+        cursor.execute(enter_query)
+        try:
             yield
-    finally:
-        set_deferred(names, using=using)
+        except BaseException:
+            # An error in the block may have flagged the connection for rollback
+            # (e.g. Django does this when a save fails inside an atomic block).
+            # We're about to roll back to our savepoint, which is what the flag
+            # is asking for, so clear it to allow our cleanup queries through.
+            # This mirrors what transaction.atomic does on the way out.
+            connection.needs_rollback = False
+            cursor.execute(error_query)
+            raise
+        else:
+            if connection.needs_rollback:
+                # Code in the block caught a database error itself,
+                # leaving the connection flagged for rollback.
+                # Honour the flag as transaction.atomic would:
+                # roll back to our savepoint rather than releasing it.
+                connection.needs_rollback = False
+                cursor.execute(error_query)
+            else:
+                cursor.execute(exit_query)
 
 
 def set_all_immediate(*, using: str) -> None:
@@ -87,10 +156,9 @@ def set_all_immediate(*, using: str) -> None:
     Raises:
         NotInTransaction: When we try to change constraints outside of a transaction.
     """
-    if transaction.get_autocommit(using):
-        raise NotInTransaction
+    connection = _require_transaction(using)
 
-    with connections[using].cursor() as cursor:
+    with connection.cursor() as cursor:
         cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
 
 
@@ -107,17 +175,16 @@ def set_immediate(names: Sequence[str], *, using: str) -> None:
     Raises:
         NotInTransaction: When we try to change constraints outside of a transaction.
     """
-    if transaction.get_autocommit(using):
-        raise NotInTransaction
+    connection = _require_transaction(using)
 
     if not names:
         return
 
     query = sql.SQL("SET CONSTRAINTS {names} IMMEDIATE").format(
-        names=sql.SQL(", ").join(sql.Identifier(name) for name in names)
+        names=_names_sql(tuple(names))
     )
 
-    with connections[using].cursor() as cursor:
+    with connection.cursor() as cursor:
         cursor.execute(query)
 
 
@@ -134,20 +201,43 @@ def set_deferred(names: Sequence[str], *, using: str) -> None:
     Raises:
         NotInTransaction: When we try to change constraints outside of a transaction.
     """
-    if transaction.get_autocommit(using):
-        raise NotInTransaction
+    connection = _require_transaction(using)
 
     if not names:
         return
 
     query = sql.SQL("SET CONSTRAINTS {names} DEFERRED").format(
-        names=sql.SQL(", ").join(sql.Identifier(name) for name in names)
+        names=_names_sql(tuple(names))
     )
 
-    with connections[using].cursor() as cursor:
+    with connection.cursor() as cursor:
         cursor.execute(query)
 
 
+def _require_transaction(using: str) -> BaseDatabaseWrapper:
+    """
+    Ensure there is a transaction open on a connection, and return it.
+
+    Reading the autocommit flag directly from the connection
+    (rather than via django.db.transaction)
+    means only one walk of Django's thread-local connection handler per call,
+    and callers can reuse the returned connection rather than looking it up again.
+
+    Args:
+        using: The name of the database connection to check.
+
+    Raises:
+        NotInTransaction: When the connection is in autocommit mode.
+
+    Returns:
+        The connection, ready for further use.
+    """
+    connection = connections[using]
+    if connection.get_autocommit():
+        raise NotInTransaction
+    return connection
+
+
 class NotInTransaction(Exception):
     """
     Raised when we try to change the state of constraints outside of a transaction.
@@ -185,6 +275,22 @@ def foreign_key_constraint_name(
     Returns:
         The name of the foreign key constraint.
     """
+    return _fk_constraint_name_cached(model, field_name, using)
+
+
+@functools.lru_cache(maxsize=None)
+def _fk_constraint_name_cached(
+    model: type[models.Model], field_name: str, using: str
+) -> str:
+    """
+    Calculate (and memoize) the FK constraint name for a model's field.
+
+    The name is a pure function of the model, field, and connection vendor,
+    but calculating it means setting up a schema editor,
+    which is needlessly expensive to repeat for every call.
+
+    Model classes are singletons per import, so they are safe cache keys.
+    """
     field = model._meta.get_field(field_name)
 
     remote_field = field.remote_field
@@ -202,7 +308,7 @@ def foreign_key_constraint_name(
         # Django-stubs does not know about this method, so we have to use a type ignore.
         constraint_name = editor._fk_constraint_name(model, field, suffix)  # type: ignore[attr-defined]
 
-    return str(constraint_name).removeprefix('"').removesuffix('"')
+    return str(constraint_name).strip('"')
 
 
 class NotAForeignKey(Exception):
@@ -3,8 +3,9 @@ from __future__ import annotations
 import abc
 import contextlib
 import dataclasses
-import re
+import functools
 from collections.abc import Iterator, Sequence
+from typing import ClassVar
 
 from django import db as django_db
 
@@ -15,6 +16,39 @@ except ImportError:
     import psycopg2 as psycopg  # type: ignore[no-redef]
 
 
+# The DETAIL lines which accompany constraint violations have a fixed shape:
+#     Key (field, ...)=(value, ...) <tail>
+# where the tail identifies the kind of violation.
+_KEY_DETAIL_PREFIX = "Key ("
+_UNIQUE_DETAIL_TAIL = ") already exists."
+_FOREIGN_KEY_DETAIL_TAIL = ") is not present in table"
+
+
+def _key_detail_fields(detail: str, *, tail: str) -> str | None:
+    """
+    Extract the comma-separated field names from a 'Key (...)=(...)' DETAIL line.
+
+    This is a simple scan of the fixed message shape described above,
+    which is cheaper than a regular expression match on this hot path.
+
+    Args:
+        detail: The DETAIL line from a psycopg error.
+        tail: The end of the message which identifies the kind of violation.
+
+    Returns:
+        The field names as they appear in the message, or None if the
+        message doesn't have the expected shape.
+    """
+    if not detail.startswith(_KEY_DETAIL_PREFIX):
+        return None
+
+    fields_end = detail.find(")=(", len(_KEY_DETAIL_PREFIX))
+    if fields_end == -1 or tail not in detail[fields_end + 1 :]:
+        return None
+
+    return detail[len(_KEY_DETAIL_PREFIX) : fields_end]
+
+
 @contextlib.contextmanager
 def refine_integrity_error(
     rules: Sequence[tuple[_Rule, Exception | type[Exception]]],
@@ -35,13 +69,72 @@ def refine_integrity_error(
     try:
         yield
     except django_db.IntegrityError as e:
-        for rule, refined_error in rules:
-            if rule.is_match(e):
-                raise refined_error from e
+        # No rule can match an error without a psycopg cause,
+        # so don't bother bucketing the rules for one.
+        if rules and e.__cause__ is not None:
+            for rule, refined_error in _rules_for_cause(rules, e.__cause__):
+                if rule.is_match(e):
+                    raise refined_error from e
         raise
 
 
+def _rules_for_cause(
+    rules: Sequence[tuple[_Rule, Exception | type[Exception]]],
+    cause: BaseException | None,
+) -> Sequence[tuple[_Rule, Exception | type[Exception]]]:
+    """
+    Select the rules which could match an IntegrityError with the given cause.
+
+    Each rule only matches causes of one psycopg error class (its _cause_type),
+    so we bucket the rules by that class and dispatch to the buckets
+    for classes in the cause's MRO, rather than trying every rule in turn.
+
+    The original order of the rules is preserved,
+    so the first matching rule still wins.
+
+    The bucketing is cached per tuple of rules,
+    because call sites tend to define their rules once and reuse them.
+    (The rules can't be used as weak cache keys: they come in a tuple.)
+    """
+    try:
+        buckets = _cached_rule_buckets(tuple(rules))
+    except TypeError:
+        # The rules (or their exceptions) weren't hashable,
+        # so bucket them afresh for this call.
+        buckets = _rule_buckets(rules)
+
+    candidates: list[tuple[int, _Rule, Exception | type[Exception]]] = []
+    for cause_type in type(cause).__mro__:
+        candidates.extend(buckets.get(cause_type, ()))
+
+    candidates.sort(key=lambda candidate: candidate[0])
+    return [(rule, refined_error) for _, rule, refined_error in candidates]
+
+
+def _rule_buckets(
+    rules: Sequence[tuple[_Rule, Exception | type[Exception]]],
+) -> dict[type, list[tuple[int, _Rule, Exception | type[Exception]]]]:
+    buckets: dict[type, list[tuple[int, _Rule, Exception | type[Exception]]]] = {}
+    for index, (rule, refined_error) in enumerate(rules):
+        buckets.setdefault(rule._cause_type, []).append((index, rule, refined_error))
+    return buckets
+
+
+# The cache is bounded in case rules are built on the fly with fresh
+# exception instances, which would otherwise accumulate forever.
+_cached_rule_buckets = functools.lru_cache(maxsize=128)(_rule_buckets)
+
+
 class _Rule(abc.ABC):
+    # Without this, the slotted subclasses would still inherit
+    # a per-instance __dict__ from this base class.
+    __slots__ = ()
+
+    # The class of psycopg error (the IntegrityError's __cause__)
+    # which this rule is capable of matching.
+    # Used to avoid dispatching to rules which could never match.
+    _cause_type: ClassVar[type[Exception]]
+
     @abc.abstractmethod
     def is_match(self, error: django_db.IntegrityError) -> bool:
         """
@@ -56,7 +149,7 @@ class _Rule(abc.ABC):
         ...
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Named(_Rule):
     """
     A constraint identified by its name.
@@ -64,6 +157,8 @@ class Named(_Rule):
 
     name: str
 
+    _cause_type: ClassVar[type[Exception]] = psycopg.errors.IntegrityError
+
     def is_match(self, error: django_db.IntegrityError) -> bool:
         if not isinstance(error.__cause__, psycopg.errors.IntegrityError):
             return False
@@ -71,7 +166,7 @@ class Named(_Rule):
         return error.__cause__.diag.constraint_name == self.name
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Unique(_Rule):
     """
     A unique constraint defined by a model and a set of fields.
@@ -80,23 +175,38 @@ class Unique(_Rule):
     model: type[django_db.models.Model]
     fields: tuple[str, ...]
 
-    _pattern = re.compile(r"Key \((?P<fields>.+)\)=\(.*\) already exists.")
+    _cause_type: ClassVar[type[Exception]] = psycopg.errors.UniqueViolation
+
+    # The model's table name, cached so that is_match needn't
+    # walk the model's _meta on every error.
+    _db_table: str = dataclasses.field(init=False, repr=False, compare=False)
+
+    # The fields joined as they appear in a DETAIL line,
+    # cached so that is_match is a plain string comparison.
+    _fields_joined: str = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # object.__setattr__ is needed because the dataclass is frozen.
+        object.__setattr__(self, "_db_table", self.model._meta.db_table)
+        object.__setattr__(self, "_fields_joined", ", ".join(self.fields))
 
     def is_match(self, error: django_db.IntegrityError) -> bool:
         if not isinstance(error.__cause__, psycopg.errors.UniqueViolation):
             return False
 
-        match = self._pattern.match(error.__cause__.diag.message_detail or "")
-        if match is None:
+        fields = _key_detail_fields(
+            error.__cause__.diag.message_detail or "", tail=_UNIQUE_DETAIL_TAIL
+        )
+        if fields is None:
             return False
 
         return (
-            tuple(match.group("fields").split(", ")) == self.fields
-            and error.__cause__.diag.table_name == self.model._meta.db_table
+            fields == self._fields_joined
+            and error.__cause__.diag.table_name == self._db_table
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class PrimaryKey(_Rule):
     """
     A unique constraint on the primary key of a model.
@@ -107,7 +217,15 @@ class PrimaryKey(_Rule):
 
     model: type[django_db.models.Model]
 
-    _pattern = re.compile(r"Key \((?P<fields>.+)\)=\(.*\) already exists.")
+    _cause_type: ClassVar[type[Exception]] = psycopg.errors.UniqueViolation
+
+    # The model's table name, cached so that is_match needn't
+    # walk the model's _meta on every error.
+    _db_table: str = dataclasses.field(init=False, repr=False, compare=False)
+
+    # The primary key's field name as it appears in a DETAIL line,
+    # cached so that is_match is a plain string comparison.
+    _pk_name: str = dataclasses.field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """
@@ -116,27 +234,28 @@ class PrimaryKey(_Rule):
         There's no sense in creating a rule to match a primary key constraint
         if the model has no primary key.
 
-        This helps us to justify an assert statement in is_match.
+        This also lets us cache the primary key's name for matching.
         """
         if self.model._meta.pk is None:
             raise ModelHasNoPrimaryKey
 
+        # object.__setattr__ is needed because the dataclass is frozen.
+        object.__setattr__(self, "_db_table", self.model._meta.db_table)
+        object.__setattr__(self, "_pk_name", self.model._meta.pk.name)
+
     def is_match(self, error: django_db.IntegrityError) -> bool:
         if not isinstance(error.__cause__, psycopg.errors.UniqueViolation):
             return False
 
-        match = self._pattern.match(error.__cause__.diag.message_detail or "")
-        if match is None:
+        fields = _key_detail_fields(
+            error.__cause__.diag.message_detail or "", tail=_UNIQUE_DETAIL_TAIL
+        )
+        if fields is None:
             return False
 
-        # The assert below informs Mypy that self.model._meta.pk is not None.
-        # This has been enforced in __post_init__,
-        # so this should never raise an error in practice.
-        assert self.model._meta.pk is not None
-
         return (
-            tuple(match.group("fields").split(", ")) == (self.model._meta.pk.name,)
-            and error.__cause__.diag.table_name == self.model._meta.db_table
+            fields == self._pk_name
+            and error.__cause__.diag.table_name == self._db_table
         )
 
 
@@ -146,7 +265,7 @@ class ModelHasNoPrimaryKey(Exception):
     """
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class NotNull(_Rule):
     """
     A not-null constraint on a Model's field.
@@ -155,17 +274,27 @@ class NotNull(_Rule):
     model: type[django_db.models.Model]
     field: str
 
+    _cause_type: ClassVar[type[Exception]] = psycopg.errors.NotNullViolation
+
+    # The model's table name, cached so that is_match needn't
+    # walk the model's _meta on every error.
+    _db_table: str = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # object.__setattr__ is needed because the dataclass is frozen.
+        object.__setattr__(self, "_db_table", self.model._meta.db_table)
+
     def is_match(self, error: django_db.IntegrityError) -> bool:
         if not isinstance(error.__cause__, psycopg.errors.NotNullViolation):
             return False
 
         return (
             error.__cause__.diag.column_name == self.field
-            and error.__cause__.diag.table_name == self.model._meta.db_table
+            and error.__cause__.diag.table_name == self._db_table
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class ForeignKey(_Rule):
     """
     A foreign key constraint on a Model's field.
@@ -174,21 +303,24 @@ class ForeignKey(_Rule):
     model: type[django_db.models.Model]
     field: str
 
-    _detail_pattern = re.compile(
-        r"Key \((?P<field>.+)\)=\((?P<value>.+)\) is not present in table"
-    )
+    _cause_type: ClassVar[type[Exception]] = psycopg.errors.ForeignKeyViolation
+
+    # The model's table name, cached so that is_match needn't
+    # walk the model's _meta on every error.
+    _db_table: str = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # object.__setattr__ is needed because the dataclass is frozen.
+        object.__setattr__(self, "_db_table", self.model._meta.db_table)
 
     def is_match(self, error: django_db.IntegrityError) -> bool:
         if not isinstance(error.__cause__, psycopg.errors.ForeignKeyViolation):
             return False
 
-        detail_match = self._detail_pattern.match(
-            error.__cause__.diag.message_detail or ""
+        field = _key_detail_fields(
+            error.__cause__.diag.message_detail or "", tail=_FOREIGN_KEY_DETAIL_TAIL
         )
-        if detail_match is None:
+        if field is None:
             return False
 
-        return (
-            detail_match.group("field") == self.field
-            and error.__cause__.diag.table_name == self.model._meta.db_table
-        )
+        return field == self.field and error.__cause__.diag.table_name == self._db_table
@@ -1,7 +1,48 @@
 import os
+from collections.abc import Iterator
 
 import pytest
-from pytest_django import fixtures, lazy_django
+from pytest_django import DjangoDbBlocker, fixtures, lazy_django
+
+from django_integrity import constraints
+
+
+@pytest.fixture(scope="session")
+def fk_constraint_name(
+    django_db_setup: None,
+    django_db_blocker: DjangoDbBlocker,
+) -> str:
+    """
+    The FK constraint name of ForeignKeyModel.related, computed once per session.
+
+    Several tests need this name only to pass it on to the functions under
+    test, and computing it involves setting up a schema editor. Computing it
+    once per session (the name never changes) keeps that cost out of each test.
+
+    We cannot compute it at import time because database access is blocked
+    until the test database exists.
+    """
+    # Deferred import: Django isn't ready when this conftest is imported.
+    from tests.example_app import models as test_models
+
+    with django_db_blocker.unblock():
+        return constraints.foreign_key_constraint_name(
+            model=test_models.ForeignKeyModel,
+            field_name="related_id",
+            using="default",
+        )
+
+
+@pytest.fixture(autouse=True)
+def clear_constraint_name_cache() -> Iterator[None]:
+    """
+    Reset the memoized FK constraint names between tests.
+
+    This keeps tests isolated from each other's cache state,
+    e.g. when test databases are swapped out under the same alias.
+    """
+    yield
+    constraints._fk_constraint_name_cached.cache_clear()
 
 
 @pytest.fixture(scope="session")
@@ -71,14 +71,8 @@ class TestSetAllImmediate:
 
 class TestSetImmediate:
     @pytest.mark.django_db
-    def test_set(self) -> None:
-        constraint_name = constraints.foreign_key_constraint_name(
-            model=test_models.ForeignKeyModel,
-            field_name="related_id",
-            using="default",
-        )
-
-        constraints.set_immediate(names=(constraint_name,), using="default")
+    def test_set(self, fk_constraint_name: str) -> None:
+        constraints.set_immediate(names=(fk_constraint_name,), using="default")
 
         # An error should be raised immediately.
         with pytest.raises(django_db.IntegrityError):
@@ -153,19 +147,13 @@ class TestImmediate:
             constraints.set_all_immediate(using="default")
 
     @pytest.mark.django_db
-    def test_constraint_enforced(self) -> None:
+    def test_constraint_enforced(self, fk_constraint_name: str) -> None:
         """Constraints are enforced when explicitly enforced."""
-        constraint_name = constraints.foreign_key_constraint_name(
-            model=test_models.ForeignKeyModel,
-            field_name="related_id",
-            using="default",
-        )
-
         context_manager_successfully_entered = False
 
         # An error should be raised immediately.
         with pytest.raises(django_db.IntegrityError):
-            with constraints.immediate((constraint_name,), using="default"):
+            with constraints.immediate((fk_constraint_name,), using="default"):
                 context_manager_successfully_entered = True
 
                 # Create an instance that violates a deferred constraint.
@@ -176,15 +164,9 @@ class TestImmediate:
         assert context_manager_successfully_entered is True
 
     @pytest.mark.django_db
-    def test_deferral_restored(self) -> None:
+    def test_deferral_restored(self, fk_constraint_name: str) -> None:
         """Constraints are restored to DEFERRED after the context manager."""
-        constraint_name = constraints.foreign_key_constraint_name(
-            model=test_models.ForeignKeyModel,
-            field_name="related_id",
-            using="default",
-        )
-
-        with constraints.immediate((constraint_name,), using="default"):
+        with constraints.immediate((fk_constraint_name,), using="default"):
             pass
 
         # Create an instance that violates a deferred constraint.
@@ -195,6 +177,24 @@ class TestImmediate:
         with pytest.raises(django_db.IntegrityError):
             constraints.set_all_immediate(using="default")
 
+    @pytest.mark.django_db
+    def test_error_swallowed_in_block(self, fk_constraint_name: str) -> None:
+        """A database error caught inside the block doesn't break the exit."""
+        with constraints.immediate((fk_constraint_name,), using="default"):
+            try:
+                # Create an instance that violates the now-immediate constraint.
+                test_models.ForeignKeyModel.objects.create(related_id=42)
+            except django_db.IntegrityError:
+                pass
+
+        # The block was rolled back and the constraint is deferred again,
+        # so no error should be raised here.
+        test_models.ForeignKeyModel.objects.create(related_id=42)
+
+        # We catch the error here to prevent the test from failing in shutdown.
+        with pytest.raises(django_db.IntegrityError):
+            constraints.set_all_immediate(using="default")
+
     @pytest.mark.django_db(transaction=True)
     def test_not_in_transaction(self) -> None:
         # Fail if we're not in a transaction.
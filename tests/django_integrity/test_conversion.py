@@ -1,3 +1,5 @@
+import re
+
 import pytest
 from django import db as django_db
 
@@ -5,10 +7,32 @@ from django_integrity import constraints, conversion
 from tests.example_app import models as test_models
 
 
+# Patterns for the mismatch tests below, to check that the *original*
+# database error is what escapes when no rule matches.
+# Precompiled once so that the many mismatch tests don't re-parse them.
+_DUPLICATE_KEY_RE = re.compile(r"duplicate key value violates unique constraint")
+_FOREIGN_KEY_RE = re.compile(r"violates foreign key constraint")
+_NOT_NULL_RE = re.compile(r"violates not-null constraint")
+
+
 class SimpleError(Exception):
     pass
 
 
+@pytest.fixture
+def existing_unique_instance(db: None) -> test_models.UniqueModel:
+    """
+    A pre-existing instance to violate unique constraints against.
+
+    The tests which need one all use the same instance,
+    so we create it in one shared fixture instead of repeating the setup.
+
+    It cannot be scoped more widely than a test:
+    each test's transaction is rolled back, taking the row with it.
+    """
+    return test_models.UniqueModel.objects.create(unique_field=42)
+
+
 class TestRefineIntegrityError:
     def test_no_rules(self) -> None:
         # It is legal to call the context manager without any rules.
@@ -18,10 +42,9 @@ class TestRefineIntegrityError:
 
 @pytest.mark.django_db
 class TestNamedConstraint:
-    def test_error_refined(self) -> None:
-        # Create a unique instance so that we can violate the constraint later.
-        test_models.UniqueModel.objects.create(unique_field=42)
-
+    def test_error_refined(
+        self, existing_unique_instance: test_models.UniqueModel
+    ) -> None:
         rules = ((conversion.Named(name="unique_model_unique_field_key"), SimpleError),)
 
         # The original error should be transformed into our expected error.
@@ -29,25 +52,23 @@ class TestNamedConstraint:
             with conversion.refine_integrity_error(rules):
                 test_models.UniqueModel.objects.create(unique_field=42)
 
-    def test_rules_mismatch(self) -> None:
-        # Create a unique instance so that we can violate the constraint later.
-        test_models.UniqueModel.objects.create(unique_field=42)
-
+    def test_rules_mismatch(
+        self, existing_unique_instance: test_models.UniqueModel
+    ) -> None:
         # No constraints match the error:
         rules = ((conversion.Named(name="nonexistent_constraint"), SimpleError),)
 
         # The original error should be raised.
-        with pytest.raises(django_db.IntegrityError):
+        with pytest.raises(django_db.IntegrityError, match=_DUPLICATE_KEY_RE):
             with conversion.refine_integrity_error(rules):
                 test_models.UniqueModel.objects.create(unique_field=42)
 
 
 @pytest.mark.django_db
 class TestUnique:
-    def test_error_refined(self) -> None:
-        # Create a unique instance so that we can violate the constraint later.
-        test_models.UniqueModel.objects.create(unique_field=42)
-
+    def test_error_refined(
+        self, existing_unique_instance: test_models.UniqueModel
+    ) -> None:
         rules = (
             (
                 conversion.Unique(
@@ -100,15 +121,13 @@ class TestUnique:
         self,
         Model: type[test_models.AlternativeUniqueModel | test_models.UniqueModel],
         field: str,
+        existing_unique_instance: test_models.UniqueModel,
     ) -> None:
         # A rule that matches a similar looking, but different, unique constraint.
-        # Create a unique instance so that we can violate the constraint later.
-        test_models.UniqueModel.objects.create(unique_field=42)
-
         rules = ((conversion.Unique(model=Model, fields=(field,)), SimpleError),)
 
         # We shouldn't transform the error, because it didn't match the rule.
-        with pytest.raises(django_db.IntegrityError):
+        with pytest.raises(django_db.IntegrityError, match=_DUPLICATE_KEY_RE):
             with conversion.refine_integrity_error(rules):
                 test_models.UniqueModel.objects.create(unique_field=42)
 
@@ -153,7 +172,7 @@ class TestPrimaryKey:
         rules = ((conversion.PrimaryKey(model=test_models.UniqueModel), SimpleError),)
 
         # The original error should be raised.
-        with pytest.raises(django_db.IntegrityError):
+        with pytest.raises(django_db.IntegrityError, match=_DUPLICATE_KEY_RE):
             with conversion.refine_integrity_error(rules):
                 test_models.PrimaryKeyModel.objects.create(pk=existing_primary_key)
 
@@ -195,7 +214,7 @@ class TestNotNull:
             ),
         )
 
-        with pytest.raises(django_db.IntegrityError):
+        with pytest.raises(django_db.IntegrityError, match=_NOT_NULL_RE):
             with conversion.refine_integrity_error(rules):
                 # We ignore the type error because it's picking up on the error we're testing.
                 test_models.UniqueModel.objects.create(unique_field=None)  # type: ignore[misc]
@@ -212,7 +231,7 @@ class TestNotNull:
         )
 
         # The original error should be raised.
-        with pytest.raises(django_db.IntegrityError):
+        with pytest.raises(django_db.IntegrityError, match=_NOT_NULL_RE):
             with conversion.refine_integrity_error(rules):
                 test_models.AlternativeUniqueModel.objects.create(
                     # We ignore the type error because it's picking up on the error we're testing.
@@ -223,6 +242,12 @@ class TestNotNull:
 
 @pytest.mark.django_db
 class TestForeignKey:
+    @pytest.fixture(autouse=True)
+    def _all_constraints_immediate(self, db: None) -> None:
+        # Every test here needs foreign key violations reported immediately,
+        # rather than at the end of the transaction.
+        constraints.set_all_immediate(using="default")
+
     def test_error_refined(self) -> None:
         rules = (
             (
@@ -232,7 +257,6 @@ class TestForeignKey:
                 SimpleError,
             ),
         )
-        constraints.set_all_immediate(using="default")
 
         # The original error should be transformed into our expected error.
         with pytest.raises(SimpleError):
@@ -250,9 +274,8 @@ class TestForeignKey:
                 SimpleError,
             ),
         )
-        constraints.set_all_immediate(using="default")
 
-        with pytest.raises(django_db.IntegrityError):
+        with pytest.raises(django_db.IntegrityError, match=_FOREIGN_KEY_RE):
             with conversion.refine_integrity_error(rules):
                 test_models.ForeignKeyModel.objects.create(related_id=42)
 
@@ -266,8 +289,7 @@ class TestForeignKey:
                 SimpleError,
             ),
         )
-        constraints.set_all_immediate(using="default")
 
-        with pytest.raises(django_db.IntegrityError):
+        with pytest.raises(django_db.IntegrityError, match=_FOREIGN_KEY_RE):
             with conversion.refine_integrity_error(rules):
                 test_models.ForeignKeyModel3.objects.create(related_1_id=42)
@@ -1,12 +1,11 @@
-from environs import Env
+import os
 
-
-env = Env()
+import dj_database_url
 
 
 DATABASES = {
-    "default": env.dj_db_url(
-        "DATABASE_URL", default="postgres://localhost/django_integrity"
+    "default": dj_database_url.parse(
+        os.environ.get("DATABASE_URL", "postgres://localhost/django_integrity")
     ),
 }
 SECRET_KEY = "test-secret-key"